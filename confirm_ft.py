@@ -1,9 +1,17 @@
 import sysconfig
+from functools import cache
 
-is_free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
-print(f"Is this a free-threaded build? {is_free_threaded_build}")
 
-if is_free_threaded_build:
-    print("The Python executable was compiled with free-threading support.")
-else:
-    print("The Python executable is a standard GIL-enabled build.")
+@cache
+def is_free_threaded_build() -> bool:
+    """Return True if the running interpreter was built with free-threading."""
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+if __name__ == "__main__":
+    print(f"Is this a free-threaded build? {is_free_threaded_build()}")
+
+    if is_free_threaded_build():
+        print("The Python executable was compiled with free-threading support.")
+    else:
+        print("The Python executable is a standard GIL-enabled build.")
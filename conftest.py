@@ -14,18 +14,15 @@ until a failure occurs, then pytest will crash with RecursionError.
 Workaround if needed: Use `python -m doctest src/tdom_path/*.py` directly.
 """
 
-from sybil import Sybil
-from sybil.parsers.myst import PythonCodeBlockParser
-from sybil.parsers.rest import DocTestParser
+from functools import cache
 
-# Import here to avoid duplication with docs/conftest.py
-# These are only needed for README.md
-from pathlib import PurePosixPath
-from typing import Protocol
-from importlib.resources.abc import Traversable
-from tdom import Element, html
-from tdom_path import make_traversable, make_path_nodes, path_nodes, render_path_nodes
-from tdom_path.tree import RelativePathStrategy
+# Directories that never hold tests; skip them before pytest walks into them.
+# Hidden directories such as .git are already skipped by norecursedirs, and
+# docs/*.md must stay collectable for docs/conftest.py.
+collect_ignore_glob = ["docs/_build", "**/__pycache__", "**/node_modules"]
+
+# Only these suffixes can match the Sybil patterns below
+_SYBIL_SUFFIXES = frozenset({".py", ".md"})
 
 
 # Mock Heading class - points to examples/mysite/components/heading
@@ -33,41 +30,70 @@ class Heading:
     __module__ = "mysite.components.heading"
 
 
-# Configure Sybil for src/ Python files (minimal globals)
-_sybil_src = Sybil(
-    parsers=[DocTestParser()],
-    patterns=["*.py"],
-    path="src",
-    setup=lambda ns: ns.update({"Heading": Heading}),
-)
-
-# Configure Sybil for README.md (comprehensive globals)
-_sybil_readme = Sybil(
-    parsers=[PythonCodeBlockParser()],
-    patterns=["README.md"],
-    path=".",
-    setup=lambda ns: ns.update(
-        {
-            "Heading": Heading,
-            "Element": Element,
-            "html": html,
-            "make_traversable": make_traversable,
-            "make_path_nodes": make_path_nodes,
-            "render_path_nodes": render_path_nodes,
-            "path_nodes": path_nodes,
-            "RelativePathStrategy": RelativePathStrategy,
-            "PurePosixPath": PurePosixPath,
-            "Protocol": Protocol,
-            "Traversable": Traversable,
-        }
-    ),
-)
-
-# Combine hooks
-_src_hook = _sybil_src.pytest()
-_readme_hook = _sybil_readme.pytest()
+# Sybil is built lazily on the first file that can use it, so pytest runs
+# that never collect src/*.py or README.md skip the Sybil and tdom imports
+# entirely.
+@cache
+def _get_sybil_hook():
+    """Build one Sybil collection hook for src/ and README.md.
+
+    Both configurations are combined into a single SybilCollection so each
+    collected file goes through one hook call instead of two.
+    """
+    # Imported here to avoid duplication with docs/conftest.py
+    # These are only needed for README.md
+    from importlib.resources.abc import Traversable
+    from pathlib import PurePosixPath
+    from typing import Protocol
+
+    from sybil import Sybil
+    from sybil.parsers.myst import PythonCodeBlockParser
+    from sybil.parsers.rest import DocTestParser
+    from tdom import Element, html
+    from tdom_path import (
+        make_path_nodes,
+        make_traversable,
+        path_nodes,
+        render_path_nodes,
+    )
+    from tdom_path.tree import RelativePathStrategy
+
+    # Configure Sybil for src/ Python files (minimal globals)
+    sybil_src = Sybil(
+        parsers=[DocTestParser()],
+        patterns=["*.py"],
+        path="src",
+        setup=lambda ns: ns.update({"Heading": Heading}),
+    )
+
+    # Configure Sybil for README.md (comprehensive globals)
+    sybil_readme = Sybil(
+        parsers=[PythonCodeBlockParser()],
+        patterns=["README.md"],
+        path=".",
+        setup=lambda ns: ns.update(
+            {
+                "Heading": Heading,
+                "Element": Element,
+                "html": html,
+                "make_traversable": make_traversable,
+                "make_path_nodes": make_path_nodes,
+                "render_path_nodes": render_path_nodes,
+                "path_nodes": path_nodes,
+                "RelativePathStrategy": RelativePathStrategy,
+                "PurePosixPath": PurePosixPath,
+                "Protocol": Protocol,
+                "Traversable": Traversable,
+            }
+        ),
+    )
+
+    return (sybil_src + sybil_readme).pytest()
 
 
 def pytest_collect_file(file_path, parent):
     """Collect from src/ and README.md."""
-    return _src_hook(file_path, parent) or _readme_hook(file_path, parent)
+    # Check the suffix first so unrelated files never touch Sybil
+    if file_path.suffix not in _SYBIL_SUFFIXES:
+        return None
+    return _get_sybil_hook()(file_path, parent)
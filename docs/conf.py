@@ -3,6 +3,8 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import os
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -13,18 +15,25 @@ author = "tdom-path contributors"
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# Set DOCS_FULL=1 for the published site; local builds skip the slower extensions
+DOCS_FULL = bool(os.environ.get("DOCS_FULL"))
+
 # Add any Sphinx extension module names here, as strings
 extensions = [
     "myst_parser",  # MyST Markdown support
     "sphinx.ext.autodoc",  # API documentation from docstrings
-    "sphinx.ext.viewcode",  # Add links to source code
     "sphinx.ext.todo",  # Support for to do items
     "sphinx.ext.napoleon",  # Support for NumPy and Google style docstrings
-    "sphinxcontrib.mermaid",  # Mermaid diagram support
 ]
+if DOCS_FULL:
+    extensions += [
+        "sphinx.ext.viewcode",  # Add links to source code (walks every module)
+        "sphinxcontrib.mermaid",  # Mermaid diagram support
+    ]
 
 # MyST configuration for Markdown support
-myst_enable_extensions = [
+# An immutable tuple; MyST converts it to a set once when the config is read
+myst_enable_extensions = (
     "amsmath",
     "colon_fence",
     "deflist",
@@ -38,13 +47,14 @@ myst_enable_extensions = [
     "strikethrough",
     "substitution",
     "tasklist",
-]
+)
 
 pygments_style = "sphinx"  # or 'default', 'monokai', etc.
 pygments_dark_style = "monokai"  # for dark mode (Sphinx 5.0+)
 
 # Disable Pygments highlighting for mermaid code blocks
-myst_fence_as_directive = ["mermaid"]
+# Without the mermaid extension, mermaid fences stay plain code blocks
+myst_fence_as_directive = ["mermaid"] if DOCS_FULL else []
 
 # Napoleon settings for docstring parsing
 napoleon_google_docstring = True
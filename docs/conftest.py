@@ -4,15 +4,7 @@ This conftest handles docs/**/*.md only (README.md is in root conftest.py)
 Uses PythonCodeBlockParser to parse ```python blocks containing doctest syntax.
 """
 
-from pathlib import PurePosixPath
-from typing import Protocol
-from importlib.resources.abc import Traversable
-
-from sybil import Sybil
-from sybil.parsers.myst import PythonCodeBlockParser
-from tdom import Element, html
-from tdom_path import make_traversable, make_path_nodes, path_nodes, render_path_nodes
-from tdom_path.tree import RelativePathStrategy
+from functools import cache
 
 
 # Mock Heading class
@@ -20,24 +12,50 @@ class Heading:
     __module__ = "mysite.components.heading"
 
 
-# Configure Sybil for docs/ markdown files
-pytest_collect_file = Sybil(
-    parsers=[PythonCodeBlockParser()],
-    patterns=["*.md"],
-    path=".",
-    setup=lambda ns: ns.update(
-        {
-            "Heading": Heading,
-            "Element": Element,
-            "html": html,
-            "make_traversable": make_traversable,
-            "make_path_nodes": make_path_nodes,
-            "render_path_nodes": render_path_nodes,
-            "path_nodes": path_nodes,
-            "RelativePathStrategy": RelativePathStrategy,
-            "PurePosixPath": PurePosixPath,
-            "Protocol": Protocol,
-            "Traversable": Traversable,
-        }
-    ),
-).pytest()
+# Sybil is built lazily on the first markdown file, so pytest runs that
+# collect no docs skip the Sybil and tdom imports entirely.
+@cache
+def _get_docs_hook():
+    """Build the Sybil collection hook for docs/ markdown files."""
+    from importlib.resources.abc import Traversable
+    from pathlib import PurePosixPath
+    from typing import Protocol
+
+    from sybil import Sybil
+    from sybil.parsers.myst import PythonCodeBlockParser
+    from tdom import Element, html
+    from tdom_path import (
+        make_path_nodes,
+        make_traversable,
+        path_nodes,
+        render_path_nodes,
+    )
+    from tdom_path.tree import RelativePathStrategy
+
+    return Sybil(
+        parsers=[PythonCodeBlockParser()],
+        patterns=["*.md"],
+        path=".",
+        setup=lambda ns: ns.update(
+            {
+                "Heading": Heading,
+                "Element": Element,
+                "html": html,
+                "make_traversable": make_traversable,
+                "make_path_nodes": make_path_nodes,
+                "render_path_nodes": render_path_nodes,
+                "path_nodes": path_nodes,
+                "RelativePathStrategy": RelativePathStrategy,
+                "PurePosixPath": PurePosixPath,
+                "Protocol": Protocol,
+                "Traversable": Traversable,
+            }
+        ),
+    ).pytest()
+
+
+def pytest_collect_file(file_path, parent):
+    """Collect doctests from docs/ markdown files."""
+    if file_path.suffix != ".md":
+        return None
+    return _get_docs_hook()(file_path, parent)
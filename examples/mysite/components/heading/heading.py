@@ -4,6 +4,8 @@
 class Heading:
     """A heading component that references a static stylesheet."""
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str = "Hello World") -> None:
         """Initialize heading with text.
 
@@ -8,7 +8,20 @@ Phase 2: Tree Rewriting - make_path_nodes for automatic asset resolution
 Phase 3: Path Rendering - render_path_nodes for relative path string conversion
 """
 
-from tdom_path.tree import make_path_nodes, path_nodes, render_path_nodes
+from tdom_path.tree import (
+    clear_asset_cache,
+    make_and_render_path_nodes,
+    make_path_nodes,
+    path_nodes,
+    render_path_nodes,
+)
 from tdom_path.webpath import make_traversable
 
-__all__ = ["make_traversable", "make_path_nodes", "path_nodes", "render_path_nodes"]
+__all__ = [
+    "clear_asset_cache",
+    "make_traversable",
+    "make_path_nodes",
+    "make_and_render_path_nodes",
+    "path_nodes",
+    "render_path_nodes",
+]
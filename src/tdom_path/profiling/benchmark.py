@@ -4,14 +4,21 @@
 Run this before and after optimizations to measure improvements.
 """
 
+import statistics
 import sys
 import time
+import timeit
 from pathlib import PurePosixPath
 
 
 from tdom import html
 
-from tdom_path import make_path_nodes, render_path_nodes, make_traversable
+from tdom_path import (
+    clear_asset_cache,
+    make_path_nodes,
+    render_path_nodes,
+    make_traversable,
+)
 from tdom_path.tree import _walk_tree
 
 
@@ -55,25 +62,48 @@ def create_test_tree():
 
 
 def benchmark_operation(
-    name: str, operation, iterations: int = 100, warmup: bool = True
+    name: str,
+    operation,
+    iterations: int = 100,
+    warmup: bool = True,
+    repeat: int = 5,
 ):
-    """Benchmark a single operation."""
-    # Warmup to ensure JIT compilation, etc. (but skip for cold cache tests)
-    if warmup:
-        for _ in range(10):
+    """Benchmark a single operation.
+
+    Warm runs let timeit calibrate the loop count with autorange() (which also
+    serves as warmup) and report the best of ``repeat`` runs. Cold runs time a
+    fixed number of iterations once, as any repeat would only see a warm cache.
+    """
+    if not warmup:
+        # Integer nanosecond clock keeps float arithmetic out of the timed region
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
             result = operation()
+            # Prevent optimization by accessing result
+            _ = result
+        end = time.perf_counter_ns()
 
-    start = time.perf_counter()
-    for _ in range(iterations):
-        result = operation()
-        # Prevent optimization by accessing result
-        _ = result
-    end = time.perf_counter()
+        total_time = (end - start) / 1_000  # Convert to microseconds
+        avg_time = total_time / iterations
 
-    total_time = (end - start) * 1_000_000  # Convert to microseconds
-    avg_time = total_time / iterations
+        print(f"  {name:<45} {avg_time:>10.3f}μs/op  ({iterations} iterations)")
+        return avg_time
 
-    print(f"  {name:<45} {avg_time:>10.3f}μs/op  ({iterations} iterations)")
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    samples = [
+        total / number * 1_000_000  # Convert to microseconds per op
+        for total in timer.repeat(repeat=repeat, number=number)
+    ]
+
+    # Min is the least noisy estimate; stdev shows how much the runs disagreed
+    avg_time = min(samples)
+    spread = statistics.stdev(samples) if repeat > 1 else 0.0
+
+    print(
+        f"  {name:<45} {avg_time:>10.3f}μs/op  "
+        f"(best of {repeat} x {number}, ±{spread:.3f}μs)"
+    )
     return avg_time
 
 
@@ -94,9 +124,9 @@ def run_benchmark():
 
     # Path resolution benchmarks - COLD CACHE
     print("\n  [Cold cache tests - measuring first-time module loading...]")
-    from tdom_path.webpath import _get_module_files
 
-    _get_module_files.cache_clear()  # Clear cache for cold test
+    # Clear every resolution cache for the cold test
+    clear_asset_cache()
 
     # Add examples to path for Heading component
     sys.path.insert(0, "examples")
@@ -126,7 +156,6 @@ def run_benchmark():
     results["make_path_nodes"] = benchmark_operation(
         "make_path_nodes() - tree transform",
         lambda: make_path_nodes(tree, Heading),
-        iterations=50,
     )
 
     # Pre-transform tree for rendering benchmark
@@ -141,17 +170,20 @@ def run_benchmark():
         PurePosixPath("mysite/blog/post1.html"),
     ]
 
+    def render_all_pages():
+        # Plain loop: no throwaway result list inside the timed operation
+        for target in targets:
+            render_path_nodes(path_tree, target)
+
     results["render_multi_page"] = benchmark_operation(
         "render_path_nodes() - 4 pages (SSG scenario)",
-        lambda: [render_path_nodes(path_tree, target) for target in targets],
-        iterations=25,
+        render_all_pages,
     )
 
     # Tree traversal benchmark
     results["walk_tree"] = benchmark_operation(
         "_walk_tree() - traversal only",
         lambda: _walk_tree(tree, lambda node: node),
-        iterations=50,
     )
 
     print("-" * 85)
@@ -166,7 +198,7 @@ def run_benchmark():
 
     # Cache impact analysis
     cache_speedup = (results["make_path_cold"] / results["make_path"] - 1) * 100
-    print("\n  LRU Cache Impact:")
+    print("\n  Module Cache Impact:")
     print(
         f"    Cold cache:  {results['make_path_cold']:.1f}μs/op (first module access)"
     )
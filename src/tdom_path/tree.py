@@ -1,10 +1,10 @@
 """Tree rewriting utilities for component asset path resolution."""
 
 import inspect
-import re
+import posixpath
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib.resources.abc import Traversable
 
 # Use PurePosixPath instead of PurePath to ensure cross-platform consistency
@@ -14,7 +14,13 @@ from pathlib import PurePosixPath
 from typing import Any, Protocol, TypeGuard, ParamSpec
 
 from tdom import Element, Fragment, Node
-from tdom_path.webpath import make_traversable, _normalize_module_name
+from tdom_path.webpath import (
+    _MODULE_FILES_CACHE,
+    _PACKAGE_ASSET_CACHE,
+    _RELATIVE_ASSET_CACHE,
+    _normalize_module_name,
+    make_traversable,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,20 +55,36 @@ class AssetReference:
     module_path: PurePosixPath
 
 
-@dataclass(frozen=True, slots=True)
 class _TraversableWithPath:
     """Pairs a Traversable with its module-relative path.
 
     This simple container stores both the filesystem Traversable and the
     module-relative path needed for relative path calculation and asset collection.
 
+    A plain slotted class rather than a frozen dataclass: instances are only
+    ever read and compared by identity, so construction skips the frozen
+    __setattr__ workaround and no __eq__/__hash__ is generated.
+
     Attributes:
         traversable: The Traversable instance for file access
         module_path: Module-relative path (e.g., "mysite/components/heading/static/styles.css")
+        asset_ref: AssetReference for this pair, built once so that renders add
+                   the same object to collected_assets instead of a new one each time
     """
 
+    __slots__ = ("asset_ref", "module_path", "traversable")
+
     traversable: Traversable
     module_path: PurePosixPath
+    asset_ref: AssetReference
+
+    def __init__(self, traversable: Traversable, module_path: PurePosixPath) -> None:
+        self.traversable = traversable
+        self.module_path = module_path
+        self.asset_ref = AssetReference(source=traversable, module_path=module_path)
+
+    def __repr__(self) -> str:
+        return f"_TraversableWithPath({self.traversable!r}, {self.module_path!r})"
 
     def __str__(self) -> str:
         """Return the module-relative path as a string."""
@@ -73,13 +95,29 @@ class _TraversableWithPath:
 P = ParamSpec("P")
 type R = Node
 
-# Compile regex once at module load time for performance
-_EXTERNAL_URL_PATTERN = re.compile(
-    r"^(https?://|//|mailto:|tel:|data:|javascript:|#)", re.IGNORECASE
+# Asset-bearing tags mapped to the attribute holding their asset path
+_ASSET_ATTRS: dict[str, str] = {"link": "href", "script": "src"}
+
+# Lowercase scheme prefixes of external/special URLs that are never rewritten
+# (protocol-relative "//" and "#" fragments are handled by their first char)
+_EXTERNAL_PREFIXES = (
+    "http://",
+    "https://",
+    "mailto:",
+    "tel:",
+    "data:",
+    "javascript:",
+)
+
+# Length of the longest prefix - only this much of an href needs lowercasing
+_EXTERNAL_PREFIX_LEN = max(map(len, _EXTERNAL_PREFIXES))
+
+# First characters (either case) that can start an external scheme
+_EXTERNAL_INITIALS = frozenset(
+    char for prefix in _EXTERNAL_PREFIXES for char in (prefix[0], prefix[0].upper())
 )
 
 
-@dataclass(slots=True)
 class TraversableElement(Element):
     """Element subclass that allows Traversable attribute values.
 
@@ -91,8 +129,10 @@ class TraversableElement(Element):
     Traversable values are automatically converted to strings via __str__(),
     producing module-relative path strings in the final HTML output.
 
-    All other behavior is inherited from Element, including __post_init__
-    validation and __str__() rendering.
+    All other behavior is inherited from Element, including the dataclass
+    __init__, __post_init__ validation and __str__() rendering. The subclass
+    adds no slots and no generated methods, so construction costs the same as
+    a plain Element.
 
     Examples:
         >>> from importlib.resources.abc import Traversable
@@ -111,9 +151,101 @@ class TraversableElement(Element):
         'mysite/components/heading/static/styles.css" />'
     """
 
+    __slots__ = ()
+
+    # Type-only override - the attrs field itself is inherited from Element
     attrs: dict[str, str | Traversable | _TraversableWithPath | None]
 
 
+# Node types the walkers descend into - checked with isinstance() so that
+# subclasses of Element and Fragment are walked too
+_CONTAINER_TYPES = (Element, Fragment)
+
+# Raw text elements - their content is never parsed as markup, so they cannot
+# contain <link> or <script> elements and the walkers do not descend into them
+_RAW_TEXT_TAGS = frozenset({"script", "style", "textarea", "title"})
+
+
+@lru_cache(maxsize=256)
+def _target_dir(target: PurePosixPath) -> PurePosixPath:
+    """Get the cached parent directory of a render target.
+
+    SSG builds render many assets against the same handful of targets, so the
+    parent directory is computed once per target instead of once per asset.
+
+    Args:
+        target: The PurePosixPath target output location
+
+    Returns:
+        The directory containing the target
+
+    Examples:
+        >>> _target_dir(PurePosixPath("mysite/pages/about.html"))
+        PurePosixPath('mysite/pages')
+        >>> _target_dir(PurePosixPath("index.html"))
+        PurePosixPath('.')
+    """
+    return target.parent
+
+
+@lru_cache(maxsize=1024)
+def _relative_path(source: str, target_dir: str) -> str:
+    """Calculate the cached relative path from a directory to a source path.
+
+    Assets repeat across pages, so the same (source, target_dir) pair is
+    relativized many times during a site build. Keying the cache on strings
+    keeps lookups cheap and avoids re-hashing PurePosixPath objects.
+
+    Both arguments are normalized POSIX path strings (as produced by
+    str(PurePosixPath)), so relative paths are computed with plain string
+    operations. The result matches PurePosixPath.relative_to(walk_up=True).
+
+    Args:
+        source: Module-relative source path (e.g., "mysite/static/styles.css")
+        target_dir: Directory of the target output location (e.g., "mysite/pages")
+
+    Returns:
+        Relative path string from target_dir to source, or source unchanged
+        if no relative path exists
+
+    Examples:
+        >>> _relative_path("mysite/components/heading/static/styles.css", "mysite/pages")
+        '../components/heading/static/styles.css'
+        >>> _relative_path("static/styles.css", ".")
+        'static/styles.css'
+        >>> _relative_path("mysite/pages", "mysite/pages")
+        '.'
+    """
+    if source.startswith("/") or target_dir.startswith("/"):
+        # Absolute paths (bare Traversable last resort) - leave anchors to pathlib
+        try:
+            return str(PurePosixPath(source).relative_to(target_dir, walk_up=True))
+        except ValueError:
+            # If relative_to fails (rare edge case), return source path as-is
+            return source
+
+    # "." is the empty relative path
+    source_parts = source.split("/") if source != "." else []
+    target_parts = target_dir.split("/") if target_dir != "." else []
+
+    # Length of the shared leading directories
+    common = 0
+    for source_part, target_part in zip(source_parts, target_parts):
+        if source_part != target_part:
+            break
+        common += 1
+
+    # Can't climb out of a ".." directory - pathlib raises ValueError here
+    if ".." in target_parts[common:]:
+        return source
+
+    # Climb up from target_dir to the shared directory, then down to source
+    # Example: from mysite/pages to mysite/components/heading/static/styles.css
+    # becomes: ../components/heading/static/styles.css
+    parts = [".."] * (len(target_parts) - common) + source_parts[common:]
+    return "/".join(parts) or "."
+
+
 def _should_process_href(href: str | None) -> TypeGuard[str]:
     """Check if href should be processed (skip external/special URLs).
 
@@ -126,7 +258,17 @@ def _should_process_href(href: str | None) -> TypeGuard[str]:
     if not isinstance(href, str) or not href:
         return False
 
-    return not _EXTERNAL_URL_PATTERN.match(href)
+    # Dispatch on the first character so typical local paths
+    # ("static/...", "./...") return without any string copies
+    first = href[0]
+    if first == "#":
+        return False
+    if first == "/":
+        return not href.startswith("//")
+    if first not in _EXTERNAL_INITIALS:
+        return True
+
+    return not href[:_EXTERNAL_PREFIX_LEN].lower().startswith(_EXTERNAL_PREFIXES)
 
 
 def _validate_asset_exists(
@@ -188,23 +330,35 @@ def _validate_asset_exists(
         raise FileNotFoundError(error_msg)
 
 
-def _walk_tree(node: Node, transform_fn: Callable[[Node], Node]) -> Node:
-    """Recursively walk a Node tree and apply a transformation function.
+def _walk_tree(
+    node: Node,
+    transform_fn: Callable[[Node], Node],
+    skip_tags: frozenset[str] = frozenset(),
+) -> Node:
+    """Walk a Node tree and apply a transformation function to every node.
 
     This helper function provides a generic tree-walking mechanism that:
-    - Recursively traverses Element and Fragment nodes with children
+    - Traverses Element and Fragment nodes with children using an explicit stack
     - Applies the transform_fn to each node in the tree
     - Maintains immutability by creating new nodes only when changes occur
     - Optimizes by returning the same object reference when no transformations applied
 
-    The transform_fn is called on every node before recursing into children,
-    allowing it to transform the node itself. The function should return the
-    node unchanged if no transformation is needed, or return a new node instance
-    if a transformation is applied.
+    The transform_fn is called on every node before descending into its children
+    (pre-order, left to right), allowing it to transform the node itself. The
+    function should return the node unchanged if no transformation is needed,
+    or return a new node instance if a transformation is applied.
+
+    The walk is iterative rather than recursive, so it costs no Python frame per
+    node and cannot hit the interpreter recursion limit on deeply nested trees.
+
+    Elements whose tag is in skip_tags are still passed to transform_fn, but
+    their children are left untouched. This prunes subtrees that cannot hold
+    anything the transform cares about.
 
     Args:
         node: Root node of the tree to walk
         transform_fn: Function that takes a Node and returns a Node (transformed or same)
+        skip_tags: Tags of elements whose children should not be walked
 
     Returns:
         New Node tree with transformations applied, or the same object if unchanged
@@ -224,39 +378,187 @@ def _walk_tree(node: Node, transform_fn: Callable[[Node], Node]) -> Node:
         >>> assert isinstance(result, Element)
         >>> result.attrs["data-visited"]
         'true'
+        >>>
+        >>> # Skipped tags are transformed but their children are not visited
+        >>> tree = Element(tag="div", attrs={}, children=[
+        ...     Element(tag="pre", attrs={}, children=[Element(tag="b", attrs={})])
+        ... ])
+        >>> result = _walk_tree(tree, add_data_attr, skip_tags=frozenset({"pre"}))
+        >>> pre = result.children[0]
+        >>> pre.attrs["data-visited"], pre.children[0].attrs
+        ('true', {})
     """
-    # Apply transformation to current node first
-    transformed = transform_fn(node)
-
-    # Recurse into children if node has them
-    match transformed:
-        # Element with children - recurse and rebuild if any child changed
-        case Element(children=children) if children:
-            new_children = [_walk_tree(child, transform_fn) for child in children]
-            # Optimization: Only create new Element if children actually changed
-            # This uses identity checks (is) rather than equality (==) for performance
-            # If no children changed, return the original transformed node to save memory
-            if any(new is not old for new, old in zip(new_children, children)):
-                return Element(
-                    tag=transformed.tag,
-                    attrs=transformed.attrs.copy() if transformed.attrs else {},
+    root = transform_fn(node)
+    if (
+        not isinstance(root, _CONTAINER_TYPES)
+        or not root.children
+        or (not isinstance(root, Fragment) and root.tag in skip_tags)
+    ):
+        return root
+
+    # Each frame is [transformed parent, original children, next child index,
+    # rebuilt children]. The rebuilt list stays None until a child actually
+    # changes, so unchanged subtrees never allocate a new children list.
+    frame: list[Any] = [root, root.children, 0, None]
+    stack = [frame]
+
+    # Bind the stack methods once instead of looking them up for every node
+    push = stack.append
+    pop = stack.pop
+
+    while True:
+        parent, children, index, new_children = frame
+
+        if index < len(children):
+            # Descend into the next unvisited child
+            frame[2] = index + 1
+            walked = transform_fn(children[index])
+            if (
+                isinstance(walked, _CONTAINER_TYPES)
+                and walked.children
+                and (isinstance(walked, Fragment) or walked.tag not in skip_tags)
+            ):
+                frame = [walked, walked.children, 0, None]
+                push(frame)
+                continue
+        else:
+            # All children visited - rebuild the parent only if a child changed
+            pop()
+            if new_children is None:
+                # Same object if unchanged - allows callers to detect no-ops with `is`
+                walked = parent
+            elif isinstance(parent, Fragment):
+                walked = Fragment(children=new_children)
+            else:
+                # Only the children changed - share the attrs dict rather than
+                # copying it. Nodes are never mutated in place here, transforms
+                # always build a new attrs dict when they change attributes.
+                walked = Element(
+                    tag=parent.tag,
+                    attrs=parent.attrs,
                     children=new_children,
                 )
-            # Return same object if unchanged - allows callers to detect no-ops with `is`
-            return transformed
 
-        # Fragment with children - recurse and rebuild if any child changed
-        case Fragment(children=children) if children:
-            new_children = [_walk_tree(child, transform_fn) for child in children]
-            # Optimization: Only create new Fragment if children actually changed
-            if any(new is not old for new, old in zip(new_children, children)):
-                return Fragment(children=new_children)
-            # Return same object if unchanged - allows callers to detect no-ops with `is`
-            return transformed
+            if not stack:
+                return walked
+            frame = stack[-1]
 
-        # All other nodes (Text, Comment, leaf elements, etc.)
-        case _:
-            return transformed
+        # Record the walked child in its parent frame
+        # This uses identity checks (is) rather than equality (==) for performance
+        if frame[3] is not None:
+            frame[3].append(walked)
+        else:
+            position = frame[2] - 1
+            if walked is not frame[1][position]:
+                frame[3] = [*frame[1][:position], walked]
+
+
+# Wrapped asset paths keyed on (component module, attribute value)
+# Keyed on the module name rather than the component so unhashable
+# component instances share entries with their class
+_WRAPPED_PATH_CACHE: dict[tuple[str, str], _TraversableWithPath] = {}
+
+
+def _make_wrapped_path(
+    component: Any, attr_value: str, attr_name: str
+) -> _TraversableWithPath:
+    """Resolve and validate an asset attribute value to a cached _TraversableWithPath.
+
+    Identical asset strings from the same component module resolve to the
+    same wrapper, so repeated <link>/<script> tags across a tree (and across
+    renders) skip make_traversable(), the existence check and module path
+    construction. Only assets that exist are cached, so a missing asset keeps
+    raising FileNotFoundError on every call.
+
+    Call clear_asset_cache() to reset the cache (e.g., for cold benchmarks,
+    or after assets are added, moved or deleted mid-process).
+
+    Args:
+        component: Component instance/class for make_traversable() resolution
+        attr_value: Local asset path from the element attribute
+        attr_name: Attribute name (e.g., "href", "src") for error context
+
+    Returns:
+        _TraversableWithPath pairing the Traversable with its module path
+
+    ``../`` segments are resolved against the component's package, so the
+    module path never contains them. Build tools join it onto their output
+    directory, so a path that would climb above the module root is rejected.
+
+    Raises:
+        FileNotFoundError: If the asset file does not exist
+        ValueError: If the asset path climbs above the component's module root
+
+    Examples:
+        >>> from mysite.components.heading import Heading
+        >>> wrapped = _make_wrapped_path(Heading, "static/styles.css", "href")
+        >>> str(wrapped)
+        'mysite/components/heading/static/styles.css'
+        >>> _make_wrapped_path(Heading(), "static/styles.css", "href") is wrapped
+        True
+        >>> str(_make_wrapped_path(Heading, "../heading/static/styles.css", "href"))
+        'mysite/components/heading/static/styles.css'
+    """
+    module_name = getattr(component, "__module__", "unknown")
+    cache_key = (module_name, attr_value)
+    wrapped_path = _WRAPPED_PATH_CACHE.get(cache_key)
+    if wrapped_path is not None:
+        return wrapped_path
+
+    # Calculate module-relative path for the asset
+    # This will be used for relative path calculations during rendering
+    module_web_path = _normalize_module_name(module_name).replace(".", "/")
+    # Strip a literal "./" prefix and any leading slashes (which would otherwise
+    # make the join absolute) - lstrip("./") would also eat the leading dot of
+    # hidden files such as ".hidden.css". normpath then folds ../ segments.
+    relative_asset = attr_value.removeprefix("./").lstrip("/")
+    module_path = PurePosixPath(
+        posixpath.normpath(f"{module_web_path}/{relative_asset}")
+    )
+    if module_path.parts[0] == "..":
+        msg = (
+            f"Asset path {attr_value!r} (attribute: {attr_name!r}) climbs above "
+            f"the root of module {module_name!r}"
+        )
+        raise ValueError(msg)
+
+    asset_path = make_traversable(component, attr_value)
+
+    # Validate asset existence (fail fast with clear error message)
+    _validate_asset_exists(asset_path, component, attr_name)
+
+    # Wrap the Traversable with module path for rendering - setdefault keeps
+    # the first stored wrapper if threads race, so every caller shares it
+    return _WRAPPED_PATH_CACHE.setdefault(
+        cache_key, _TraversableWithPath(asset_path, module_path)
+    )
+
+
+def clear_asset_cache() -> None:
+    """Forget all resolved and validated asset paths.
+
+    Asset resolution and existence checks are cached for the life of the
+    process, so each asset is only resolved and stat'ed once. Long-running
+    processes (dev servers, watch-mode builds) should call this when assets
+    may have been added, moved or deleted, so the next make_path_nodes() call
+    resolves and validates them again. Memoized module name normalization is
+    reset too, so the next call starts from a fully cold state (as cold cache
+    benchmarks expect).
+
+    Examples:
+        >>> from mysite.components.heading import Heading
+        >>> _ = _make_wrapped_path(Heading, "static/styles.css", "href")
+        >>> clear_asset_cache()
+        >>> len(_WRAPPED_PATH_CACHE), len(_RELATIVE_ASSET_CACHE)
+        (0, 0)
+        >>> _normalize_module_name.cache_info().currsize
+        0
+    """
+    _WRAPPED_PATH_CACHE.clear()
+    _RELATIVE_ASSET_CACHE.clear()
+    _PACKAGE_ASSET_CACHE.clear()
+    _MODULE_FILES_CACHE.clear()
+    _normalize_module_name.cache_clear()
 
 
 def _transform_asset_element(
@@ -270,7 +572,8 @@ def _transform_asset_element(
         component: Component instance/class for make_traversable() resolution
 
     Returns:
-        New Element or TraversableElement with asset attribute transformed to Traversable
+        New TraversableElement with the asset attribute transformed to Traversable,
+        or the original element if the attribute is not a local asset path
     """
     attr_value = element.attrs.get(attr_name)
 
@@ -281,46 +584,19 @@ def _transform_asset_element(
     # TypeGuard ensures attr_value is str, but add assert for type checker
     assert isinstance(attr_value, str)
 
-    # Create dict that accepts Any values (including Traversable)
-    attrs = dict[str, Any](element.attrs)
-    asset_path = make_traversable(component, attr_value)
-
-    # Validate asset existence (fail fast with clear error message)
-    _validate_asset_exists(asset_path, component, attr_name)
-
-    # Calculate module-relative path for the asset
-    # This will be used for relative path calculations during rendering
-    module_name = (
-        component.__module__ if hasattr(component, "__module__") else "unknown"
-    )
-    module_name = _normalize_module_name(module_name)
-    module_web_path = module_name.replace(".", "/")
-    module_path = PurePosixPath(module_web_path) / attr_value.lstrip("./")
-
-    # Wrap the Traversable with module path for rendering
-    wrapped_path = _TraversableWithPath(asset_path, module_path)
+    # Resolve and validate the asset (cached after the first success)
+    wrapped_path = _make_wrapped_path(component, attr_value, attr_name)
 
-    # Store the wrapped asset path
-    attrs[attr_name] = wrapped_path
+    # Copy the attrs with the wrapped asset path in a single dict build
+    attrs: dict[str, Any] = {**element.attrs, attr_name: wrapped_path}
 
-    # Check if any attr value is Traversable or _TraversableWithPath - if so, use TraversableElement
-    has_path = any(
-        isinstance(v, (Traversable, _TraversableWithPath)) for v in attrs.values()
+    # The wrapped path was just added, so the result always holds a path
+    return TraversableElement(
+        tag=element.tag,
+        attrs=attrs,
+        children=element.children,
     )
 
-    if has_path:
-        return TraversableElement(
-            tag=element.tag,
-            attrs=attrs,
-            children=element.children,
-        )
-    else:
-        return Element(
-            tag=element.tag,
-            attrs=attrs,
-            children=element.children,
-        )
-
 
 def make_path_nodes(target: Node, component: Any) -> Node:
     """Rewrite asset-bearing attributes in a tdom tree to use make_path.
@@ -335,6 +611,12 @@ def make_path_nodes(target: Node, component: Any) -> Node:
     External URLs (http://, https://, //), special schemes (mailto:, tel:,
     data:, javascript:), and anchor-only links (#...) are left unchanged.
 
+    Each asset is checked for existence the first time it resolves, and the
+    validated result is cached for the life of the process. An asset deleted
+    after its first successful resolution therefore does not raise on later
+    calls until clear_asset_cache() is called. Missing assets are never
+    cached, so they raise on every call.
+
     Args:
         target: Root node of the tree to process
         component: Component instance/class for make_traversable() resolution
@@ -342,6 +624,12 @@ def make_path_nodes(target: Node, component: Any) -> Node:
     Returns:
         New Node tree with asset attributes converted to Traversable
 
+    Raises:
+        FileNotFoundError: If a referenced asset doesn't exist (checked once
+                          per asset until clear_asset_cache() is called)
+        ValueError: If a relative asset path climbs above the component's
+                   module root
+
     Examples:
         >>> from tdom import html
         >>> from mysite.components.heading import Heading
@@ -352,23 +640,34 @@ def make_path_nodes(target: Node, component: Any) -> Node:
         ... ''')
         >>> new_tree = make_path_nodes(tree, Heading)
     """
+    # Leaf targets (text, comments, childless non-asset elements) have nothing
+    # to rewrite - return them before setting up the walk
+    if not isinstance(target, _CONTAINER_TYPES) or (
+        isinstance(target, Element)
+        and not target.children
+        and target.tag not in _ASSET_ATTRS
+    ):
+        return target
+
+    # Bind per-node lookups once per call - the closure reads them as locals
+    asset_attr_for = _ASSET_ATTRS.get
+    transform_asset = _transform_asset_element
 
     def transform(node: Node) -> Node:
         """Transform asset-bearing elements to use Traversable."""
-        match node:
-            # Transform <link> elements with href
-            case Element(tag="link"):
-                return _transform_asset_element(node, "href", component)
-
-            # Transform <script> elements with src
-            case Element(tag="script"):
-                return _transform_asset_element(node, "src", component)
-
-            # All other nodes - return unchanged
-            case _:
-                return node
+        # Transform <link href> and <script src> - one dict probe per element
+        if isinstance(node, Element):
+            attr_name = asset_attr_for(node.tag)
+            if attr_name is not None:
+                # Inline <script> blocks carry no src - skip the helper call
+                attr_value = node.attrs.get(attr_name)
+                if attr_value and isinstance(attr_value, str):
+                    return transform_asset(node, attr_name, component)
+
+        # All other nodes - return unchanged
+        return node
 
-    return _walk_tree(target, transform)
+    return _walk_tree(target, transform, _RAW_TEXT_TAGS)
 
 
 class RenderStrategy(Protocol):
@@ -427,8 +726,10 @@ class RelativePathStrategy:
     The strategy works with Traversable objects and calculates relative
     paths based on web directory structure.
 
-    Uses PurePosixPath for all path calculations to ensure cross-platform
-    consistency in web path generation.
+    Paths are handled in POSIX form (PurePosixPath inputs, forward slashes
+    only) to ensure cross-platform consistency in web path generation. The
+    relative path itself is computed with cached string operations in
+    _relative_path() rather than with PurePosixPath arithmetic.
 
     Attributes:
         site_prefix: Optional PurePosixPath prefix to prepend to all calculated paths
@@ -513,22 +814,70 @@ class RelativePathStrategy:
         # Calculate relative path from target's parent directory to source
         # Why target.parent? Because target is a file (e.g., pages/about.html),
         # and we need the directory it's in (pages/) to calculate the relative path
-        target_dir = target.parent
+        target_dir = _target_dir(target)
+
+        return _relative_path(str(source_path), str(target_dir))
+
+
+def _calculate_cached(
+    strategy: RenderStrategy,
+    source: Traversable,
+    target: PurePosixPath,
+    path_cache: dict[Traversable, str] | None,
+) -> str:
+    """Calculate a path via the strategy, reusing results from path_cache.
+
+    Args:
+        strategy: RenderStrategy for path calculation
+        source: The Traversable source path to render
+        target: Target output location for relative path calculation
+        path_cache: Per-render cache of calculated paths, or None to disable
+
+    Returns:
+        String representation of the path for use in HTML attributes
+    """
+    if path_cache is None:
+        return strategy.calculate_path(source, target)
+
+    path = path_cache.get(source)
+    if path is None:
+        path = path_cache[source] = strategy.calculate_path(source, target)
+    return path
+
+
+def _discard_asset(asset_ref: AssetReference) -> None:
+    """Asset collector for strategies without collected_assets - records nothing."""
 
-        # Use pathlib's relative_to with walk_up=True for proper relative path calculation
-        # walk_up=True allows climbing up directories with ../ notation
-        # Example: from pages/about.html to components/heading/static/styles.css
-        # becomes: ../components/heading/static/styles.css
-        try:
-            relative_path = source_path.relative_to(target_dir, walk_up=True)
-            return str(relative_path)
-        except ValueError:
-            # If relative_to fails (rare edge case), return source path as-is
-            return str(source_path)
+
+def _asset_collector(
+    strategy: RenderStrategy,
+) -> Callable[[AssetReference], object]:
+    """Get the callable that records assets for a strategy.
+
+    Args:
+        strategy: RenderStrategy that may have a collected_assets set
+
+    Returns:
+        Bound add() of the strategy's collected_assets, or a no-op collector
+        if it has none
+
+    Examples:
+        >>> strategy = RelativePathStrategy()
+        >>> _asset_collector(strategy) == strategy.collected_assets.add
+        True
+        >>> _asset_collector(object()) is _discard_asset
+        True
+    """
+    collected_assets = getattr(strategy, "collected_assets", None)
+    return collected_assets.add if collected_assets is not None else _discard_asset
 
 
 def _render_transform_node(
-    node: Node, target: PurePosixPath, strategy: RenderStrategy
+    node: Node,
+    target: PurePosixPath,
+    strategy: RenderStrategy,
+    path_cache: dict[Traversable, str] | None = None,
+    collect_asset: Callable[[AssetReference], object] | None = None,
 ) -> Node:
     """Transform TraversableElement nodes to Element nodes with string paths.
 
@@ -540,6 +889,13 @@ def _render_transform_node(
         node: The node to transform
         target: Target output location for relative path calculation
         strategy: RenderStrategy for path calculation
+        path_cache: Optional mapping of source Traversable to its calculated path
+                   string. Shared across one render pass so that assets repeated
+                   in the tree only hit the strategy once for a given target.
+        collect_asset: Optional callable receiving each AssetReference, as
+                      returned by _asset_collector(). Resolved from the
+                      strategy when not given - pass it in to resolve it
+                      once per render pass rather than once per node.
 
     Returns:
         Transformed Element node, or original node if no transformation needed
@@ -548,41 +904,43 @@ def _render_transform_node(
     if not isinstance(node, TraversableElement):
         return node
 
-    # Check if any attribute contains a Traversable or _TraversableWithPath
-    has_path_attr = any(
-        isinstance(value, (Traversable, _TraversableWithPath))
-        for value in node.attrs.values()
-    )
+    if collect_asset is None:
+        collect_asset = _asset_collector(strategy)
 
-    # If no Traversable attributes, return unchanged
-    if not has_path_attr:
-        return node
-
-    # Transform Traversable/wrapped attributes to strings using strategy
+    # Transform Traversable/wrapped attributes to strings using strategy in a
+    # single pass over attrs, noting whether any attribute held a path at all
+    has_path_attr = False
     new_attrs: dict[str, str | None] = {}
     for attr_name, attr_value in node.attrs.items():
         if isinstance(attr_value, _TraversableWithPath):
-            # Extract source Traversable and module path from NamedTuple
-            source = attr_value.traversable
-            module_path = attr_value.module_path
+            has_path_attr = True
 
-            # Create AssetReference and add to strategy's collected_assets
-            asset_ref = AssetReference(source=source, module_path=module_path)
+            # Extract source Traversable from the wrapper
+            source = attr_value.traversable
 
-            # Add to collected_assets set (deduplicates automatically)
-            # Only add if strategy has collected_assets attribute (e.g., RelativePathStrategy)
-            if hasattr(strategy, "collected_assets"):
-                strategy.collected_assets.add(asset_ref)  # type: ignore[attr-defined]
+            # Add the wrapper's AssetReference to collected_assets (deduplicates
+            # automatically) - a no-op for strategies that don't collect assets
+            collect_asset(attr_value.asset_ref)
 
             # Calculate string path using strategy (pass the unwrapped Traversable)
-            new_attrs[attr_name] = strategy.calculate_path(source, target)
+            new_attrs[attr_name] = _calculate_cached(
+                strategy, source, target, path_cache
+            )
         elif isinstance(attr_value, Traversable):
+            has_path_attr = True
+
             # Bare Traversable (shouldn't happen in normal use, but handle it)
-            new_attrs[attr_name] = strategy.calculate_path(attr_value, target)
+            new_attrs[attr_name] = _calculate_cached(
+                strategy, attr_value, target, path_cache
+            )
         else:
             # Preserve non-Traversable attributes as-is
             new_attrs[attr_name] = attr_value  # type: ignore
 
+    # If no Traversable attributes, return unchanged
+    if not has_path_attr:
+        return node
+
     # Return new Element (NOT TraversableElement) with string attributes
     return Element(
         tag=node.tag,
@@ -591,6 +949,40 @@ def _render_transform_node(
     )
 
 
+def _has_traversable_element(tree: Node) -> bool:
+    """Check whether a tree contains any TraversableElement.
+
+    Scans the tree in document order with an explicit stack and stops at the
+    first TraversableElement found, which for a typical page is in <head>.
+    Raw text elements are not scanned, matching the walkers.
+
+    Args:
+        tree: Root node of the tree to scan
+
+    Returns:
+        True if at least one TraversableElement is in the tree, False otherwise
+
+    Examples:
+        >>> from tdom import Element, Text
+        >>> _has_traversable_element(Element(tag="p", attrs={}, children=[Text("Hi")]))
+        False
+    """
+    stack = [tree]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        if isinstance(node, TraversableElement):
+            return True
+        if (
+            isinstance(node, _CONTAINER_TYPES)
+            and node.children
+            and (isinstance(node, Fragment) or node.tag not in _RAW_TEXT_TAGS)
+        ):
+            extend(reversed(node.children))
+    return False
+
+
 def render_path_nodes(
     tree: Node, target: PurePosixPath, strategy: RenderStrategy | None = None
 ) -> Node:
@@ -652,8 +1044,110 @@ def render_path_nodes(
     if strategy is None:
         strategy = RelativePathStrategy()
 
-    # Use _walk_tree with _render_transform_node helper
-    return _walk_tree(tree, lambda node: _render_transform_node(node, target, strategy))
+    # Nothing to render - skip the walk and hand back the same tree
+    if not _has_traversable_element(tree):
+        return tree
+
+    # The target is fixed for the whole pass, so each distinct asset only needs
+    # its path calculated once no matter how often it appears in the tree
+    path_cache: dict[Traversable, str] = {}
+
+    # Resolve where collected assets go once per pass, not once per asset
+    collect_asset = _asset_collector(strategy)
+
+    def transform(node: Node) -> Node:
+        """Render TraversableElement nodes to string paths."""
+        # Check the type inline so plain nodes skip the helper call
+        if not isinstance(node, TraversableElement):
+            return node
+        return _render_transform_node(node, target, strategy, path_cache, collect_asset)
+
+    return _walk_tree(tree, transform, _RAW_TEXT_TAGS)
+
+
+def make_and_render_path_nodes(
+    tree: Node,
+    component: Any,
+    target: PurePosixPath,
+    strategy: RenderStrategy | None = None,
+) -> Node:
+    """Resolve and render asset paths in a single tree walk.
+
+    Equivalent to ``render_path_nodes(make_path_nodes(tree, component), target,
+    strategy)``, but <link>/<script> assets are resolved, validated and rendered
+    to strings in one pass, without building intermediate TraversableElement
+    nodes. Use it when the target is known at the time the tree is built; keep
+    the two-step form to render one transformed tree for many targets.
+
+    Args:
+        tree: Root node of the tree to process
+        component: Component instance/class for make_traversable() resolution
+        target: PurePosixPath target output location (e.g., "mysite/pages/index.html")
+        strategy: Optional RenderStrategy for path calculation.
+                 Defaults to RelativePathStrategy() if None.
+
+    Returns:
+        New Node tree with asset attributes rendered as path strings, or the same
+        object if no changes needed
+
+    Raises:
+        FileNotFoundError: If any referenced asset doesn't exist (checked once
+                          per asset until clear_asset_cache() is called, as
+                          in make_path_nodes())
+
+    Examples:
+        >>> from pathlib import PurePosixPath
+        >>> from tdom import Element
+        >>> from mysite.components.heading import Heading
+        >>> tree = Element(tag="head", attrs={}, children=[
+        ...     Element(tag="link", attrs={"rel": "stylesheet", "href": "static/styles.css"})
+        ... ])
+        >>> target = PurePosixPath("mysite/pages/about.html")
+        >>> rendered = make_and_render_path_nodes(tree, Heading, target)
+        >>> rendered.children[0].attrs["href"]
+        '../components/heading/static/styles.css'
+    """
+    # Default to RelativePathStrategy if no strategy provided
+    if strategy is None:
+        strategy = RelativePathStrategy()
+
+    # Shared per-pass state, as in render_path_nodes
+    path_cache: dict[Traversable, str] = {}
+    collect_asset = _asset_collector(strategy)
+    asset_attr_for = _ASSET_ATTRS.get
+
+    def transform(node: Node) -> Node:
+        """Resolve and render asset-bearing elements in one step."""
+        # Elements transformed earlier still need rendering
+        if isinstance(node, TraversableElement):
+            return _render_transform_node(
+                node, target, strategy, path_cache, collect_asset
+            )
+
+        if not isinstance(node, Element):
+            return node
+
+        attr_name = asset_attr_for(node.tag)
+        if attr_name is None:
+            return node
+
+        attr_value = node.attrs.get(attr_name)
+        if not _should_process_href(attr_value):
+            return node
+
+        # Resolve and validate (cached), then render straight to a string
+        wrapped_path = _make_wrapped_path(component, attr_value, attr_name)
+        collect_asset(wrapped_path.asset_ref)
+        rendered_path = _calculate_cached(
+            strategy, wrapped_path.traversable, target, path_cache
+        )
+        return Element(
+            tag=node.tag,
+            attrs={**node.attrs, attr_name: rendered_path},
+            children=node.children,
+        )
+
+    return _walk_tree(tree, transform, _RAW_TEXT_TAGS)
 
 
 def path_nodes[**P](
@@ -690,20 +1184,52 @@ def path_nodes[**P](
         Wrapped callable with same signature that applies make_path_nodes
     """
 
+    # Decide once, at decoration time, where the component comes from:
+    # methods (first parameter self/cls) use the instance, functions themselves
+    try:
+        parameters = list(inspect.signature(func_or_method).parameters)
+    except TypeError, ValueError:
+        # No introspectable signature (builtins, some C callables) - decide at
+        # call time instead, as below
+        @wraps(func_or_method)
+        def runtime_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            result: R = func_or_method(*args, **kwargs)
+
+            # Determine component: function itself or self from method
+            if inspect.ismethod(func_or_method) or (
+                args and hasattr(args[0], "__dict__")
+            ):
+                component: Any = args[0]
+            else:
+                component = func_or_method
+            return make_path_nodes(result, component)  # type: ignore[return-value]
+
+        return runtime_wrapper
+
+    if parameters and parameters[0] in ("self", "cls"):
+        first_parameter = parameters[0]
+
+        @wraps(func_or_method)
+        def method_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # Method call - use self (first arg) as component. tdom calls
+            # function components with keyword arguments only, so without
+            # positional args look the parameter up by name, and only treat an
+            # instance as the component (a cls="btn" string is not one)
+            result: R = func_or_method(*args, **kwargs)
+            if args:
+                component: Any = args[0]
+            else:
+                component = kwargs.get(first_parameter, func_or_method)
+                if not hasattr(component, "__dict__"):
+                    component = func_or_method
+            return make_path_nodes(result, component)  # type: ignore[return-value]
+
+        return method_wrapper
+
     @wraps(func_or_method)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # Call original function/method to get Node
+        # Function call - use function itself as component
         result: R = func_or_method(*args, **kwargs)
-
-        # Determine component: function itself or self from method
-        if inspect.ismethod(func_or_method) or (args and hasattr(args[0], "__dict__")):
-            # Method call - use self (first arg) as component
-            component: Any = args[0]
-        else:
-            # Function call - use function itself as component
-            component = func_or_method
-
-        # Apply transformation and return
-        return make_path_nodes(result, component)  # type: ignore[return-value]
+        return make_path_nodes(result, func_or_method)  # type: ignore[return-value]
 
     return wrapper
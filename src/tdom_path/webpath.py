@@ -23,7 +23,7 @@ Integration:
     # Returns: Traversable instance for mysite's static/app.js resource
 """
 
-from functools import lru_cache
+from functools import cache
 from importlib.resources import files
 from importlib.resources.abc import Traversable
 from typing import Any, Literal
@@ -36,6 +36,10 @@ def _detect_path_type(asset: str) -> Literal["package", "relative"]:
     - If the path contains a colon (:), it's a package path
     - Otherwise, it's a relative path
 
+    Not called internally: make_traversable() inlines the same ``":" in asset``
+    check on its hot path. Kept as the documented reference for the rule and
+    exercised by the tests - keep the two in sync.
+
     Args:
         asset: The asset path string to analyze
 
@@ -55,6 +59,7 @@ def _detect_path_type(asset: str) -> Literal["package", "relative"]:
     return "package" if ":" in asset else "relative"
 
 
+@cache
 def _normalize_module_name(module_name: str) -> str:
     """Normalize module name by stripping repeated final component.
 
@@ -63,6 +68,9 @@ def _normalize_module_name(module_name: str) -> str:
 
     This pattern occurs when a module defines a class with the same name as its file.
 
+    Results are memoized: the input space is bounded by the application's
+    component modules.
+
     Args:
         module_name: The module name to normalize
 
@@ -77,10 +85,13 @@ def _normalize_module_name(module_name: str) -> str:
         >>> _normalize_module_name("simple")
         'simple'
     """
-    parts = module_name.split(".")
-    if len(parts) >= 2 and parts[-1] == parts[-2]:
-        return ".".join(parts[:-1])
-    return module_name
+    # Only the last two components matter, so peel them off with rpartition
+    # rather than splitting the whole name into a list and rejoining it
+    head, sep, last = module_name.rpartition(".")
+    if not sep:
+        return module_name
+    previous = head.rpartition(".")[2]
+    return head if last == previous else module_name
 
 
 def _parse_package_path(asset: str) -> tuple[str, str]:
@@ -105,14 +116,28 @@ def _parse_package_path(asset: str) -> tuple[str, str]:
         ('pkg', 'sub:file.txt')
     """
     # Split on first colon only
-    parts = asset.split(":", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    # Edge case: no colon found (shouldn't happen if _detect_path_type is used first)
+    package_name, sep, resource_path = asset.partition(":")
+    if sep:
+        return package_name, resource_path
+    # Edge case: no colon found (make_traversable only calls this for assets
+    # containing a colon)
     return asset, ""
 
 
-@lru_cache(maxsize=128)
+# Traversable roots keyed by module name, filled on first use
+# A plain dict hit is cheaper than lru_cache's key building and bookkeeping,
+# and the key space is bounded by the component modules of the application
+_MODULE_FILES_CACHE: dict[str, Traversable] = {}
+
+# Resolved relative assets keyed by (component module name, asset path)
+# Keyed on the module name rather than the component itself, so instances and
+# classes from the same module share entries and nothing is kept alive
+_RELATIVE_ASSET_CACHE: dict[tuple[str, str], Traversable] = {}
+
+# Resolved package assets keyed by (package name, resource path)
+_PACKAGE_ASSET_CACHE: dict[tuple[str, str], Traversable] = {}
+
+
 def _get_module_files(module_name: str) -> Traversable:
     """Get cached Traversable root for a module.
 
@@ -120,6 +145,9 @@ def _get_module_files(module_name: str) -> Traversable:
     module loading overhead. This provides significant performance improvement
     when the same module is referenced multiple times.
 
+    Use ``_MODULE_FILES_CACHE.clear()`` to reset the cache (e.g., for cold
+    cache benchmarks).
+
     Args:
         module_name: Fully qualified module name (e.g., "mysite.components.heading")
 
@@ -132,14 +160,20 @@ def _get_module_files(module_name: str) -> Traversable:
         >>> root is root2
         True
     """
-    return files(module_name)
+    root = _MODULE_FILES_CACHE.get(module_name)
+    if root is None:
+        # setdefault keeps whichever root was stored first if threads race
+        root = _MODULE_FILES_CACHE.setdefault(module_name, files(module_name))
+    return root
 
 
 def _resolve_package_path(package_name: str, resource_path: str) -> Traversable:
     """Resolve a package path to a Traversable instance.
 
     Uses importlib.resources.files() to get the package's Traversable root,
-    then navigates to the specific resource using the / operator.
+    then navigates to the specific resource using the / operator. Results are
+    cached in ``_PACKAGE_ASSET_CACHE``, so a package asset referenced on every
+    page is only resolved once.
 
     Args:
         package_name: The Python package name (e.g., "mysite" or "mysite.components.heading")
@@ -156,18 +190,26 @@ def _resolve_package_path(package_name: str, resource_path: str) -> Traversable:
         >>> traversable = _resolve_package_path("mysite.components.heading", "static/styles.css")
         >>> traversable.is_file()
         True
+        >>> _resolve_package_path("mysite.components.heading", "static/styles.css") is traversable
+        True
     """
+    cache_key = (package_name, resource_path)
+    cached = _PACKAGE_ASSET_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Get the package's Traversable root (cached)
     package_root = _get_module_files(package_name)
 
-    # Navigate to the resource by splitting the path and using / operator
+    # Navigate to the resource in a single joinpath call
     # This handles paths like "static/styles.css" -> static / styles.css
+    # without allocating an intermediate Traversable per segment
     result = package_root
     if resource_path:
-        for part in resource_path.split("/"):
-            result = result / part
+        result = package_root.joinpath(*resource_path.split("/"))
 
-    return result
+    # First stored result wins if threads race, so callers always share one
+    return _PACKAGE_ASSET_CACHE.setdefault(cache_key, result)
 
 
 def make_traversable(component: Any, asset: str) -> Traversable:
@@ -181,6 +223,9 @@ def make_traversable(component: Any, asset: str) -> Traversable:
     2. Relative paths: "resource/path" or "./resource/path" or "../resource/path"
        - Resolves relative to the component's module
        - Uses the component's __module__ attribute to determine the base location
+       - A leading "./" is stripped; ".." segments step up from the component's
+         package directory (e.g., "../shared/styles.css" reaches a sibling
+         package), and other leading dots are kept (".hidden.css")
 
     Path type detection is automatic based on presence of colon (:) character.
     If the path contains a colon, it's treated as a package path.
@@ -215,32 +260,39 @@ def make_traversable(component: Any, asset: str) -> Traversable:
         ImportError: If there's an issue importing a package
     """
     # Detect path type first - package paths don't need the component
-    path_type = _detect_path_type(asset)
-
-    if path_type == "package":
+    # (same check as _detect_path_type, inlined to skip a call per asset)
+    if ":" in asset:
         # Parse and resolve package path
         # Component is not needed for package paths
         package_name, resource_path = _parse_package_path(asset)
         return _resolve_package_path(package_name, resource_path)
     else:
         # For relative paths, we need the component's __module__
-        if not hasattr(component, "__module__"):
+        component_module = getattr(component, "__module__", None)
+        if component_module is None:
             msg = f"Object {component!r} has no __module__ attribute"
             raise TypeError(msg)
+
+        # Fast path: the same component asset is resolved on every render
+        cache_key = (component_module, asset)
+        cached = _RELATIVE_ASSET_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Resolve relative path using component's module
-        module_name = _normalize_module_name(component.__module__)
+        module_name = _normalize_module_name(component_module)
 
         # Get the component module's Traversable root (cached)
         module_root = _get_module_files(module_name)
 
         # Navigate to the asset using / operator
-        # Handle paths with ./ prefix by stripping it
-        clean_asset = asset.lstrip("./")
+        # Strip only a literal ./ prefix - lstrip("./") would also eat the
+        # leading dots of names like ".hidden.css" and of ../ segments
+        clean_asset = asset.removeprefix("./")
 
-        # Split path and navigate using Traversable's / operator
-        result = module_root
-        for part in clean_asset.split("/"):
-            if part:  # Skip empty parts
-                result = result / part
+        # Split path and navigate with a single joinpath call, skipping
+        # empty parts from leading or doubled slashes
+        result = module_root.joinpath(*filter(None, clean_asset.split("/")))
 
-        return result
+        # First stored result wins if threads race, so callers always share one
+        return _RELATIVE_ASSET_CACHE.setdefault(cache_key, result)
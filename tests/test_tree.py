@@ -16,7 +16,7 @@ from aria_testing import get_by_tag_name, get_all_by_tag_name
 from tdom import Element, Fragment, Text, Comment, html
 
 from examples.mysite.components.heading import Heading
-from tdom_path import make_path_nodes, path_nodes
+from tdom_path import make_and_render_path_nodes, make_path_nodes, path_nodes
 from tdom_path.tree import (
     TraversableElement,
     _walk_tree,
@@ -27,6 +27,7 @@ from tdom_path.tree import (
     RelativePathStrategy,
     _validate_asset_exists,
     _TraversableWithPath,
+    _relative_path,
 )
 from tdom_path.webpath import make_traversable
 
@@ -62,6 +63,7 @@ def _is_traversable_or_wrapped(value) -> bool:
         ("javascript:void(0)", False),
         ("#section", False),
         ("MAILTO:USER@EXAMPLE.COM", False),  # Case insensitive
+        ("JavaScript:void(0)", False),  # Longest prefix, mixed case
         # Empty/None values should NOT be processed
         (None, False),
         ("", False),
@@ -326,6 +328,33 @@ def test_walk_tree_optimization_unchanged():
     assert result is tree
 
 
+def test_walk_tree_deeply_nested():
+    """Test _walk_tree() handles trees deeper than the recursion limit."""
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    leaf = Element(tag="p", attrs={"id": "leaf"}, children=[])
+    tree = leaf
+    for _ in range(depth):
+        tree = Element(tag="div", attrs={}, children=[tree])
+
+    # Identity transform returns the same tree without RecursionError
+    assert _walk_tree(tree, lambda node: node) is tree
+
+    # Changing the innermost node rebuilds the whole spine
+    def modify_leaf(node):
+        if isinstance(node, Element) and node.tag == "p":
+            return Element(tag="p", attrs={"id": "modified"}, children=[])
+        return node
+
+    result = _walk_tree(tree, modify_leaf)
+    assert result is not tree
+    node = result
+    while node.tag == "div":
+        node = node.children[0]
+    assert node.attrs["id"] == "modified"
+
+
 # ============================================================================
 # TraversableElement Class Tests (Task Group 1)
 # ============================================================================
@@ -415,6 +444,33 @@ def test_relative_path_strategy_calculations():
     assert "components/heading/assets/js/app.js" in result
 
 
+@pytest.mark.parametrize(
+    "source,target_dir",
+    [
+        ("mysite/components/heading/static/styles.css", "mysite/pages"),
+        ("mysite/components/heading/static/styles.css", "mysite/pages/docs"),
+        ("mysite/components/heading/static/styles.css", "mysite/components/heading"),
+        ("static/styles.css", "."),
+        (".", "mysite/pages"),
+        ("mysite/pages", "mysite/pages"),
+        ("mysite/pages", "mysite/pages/docs"),
+        ("mysite/styles.css", "other"),
+        ("mysite/styles.css", "../outside"),
+        ("../shared/styles.css", "mysite"),
+        ("/abs/mysite/styles.css", "mysite/pages"),
+        ("/abs/mysite/styles.css", "/abs/pages"),
+    ],
+)
+def test_relative_path_matches_pathlib(source, target_dir):
+    """Test _relative_path string math agrees with PurePosixPath.relative_to."""
+    try:
+        expected = str(PurePosixPath(source).relative_to(target_dir, walk_up=True))
+    except ValueError:
+        expected = source
+
+    assert _relative_path(source, target_dir) == expected
+
+
 def test_relative_path_strategy_with_site_prefix():
     """Test RelativePathStrategy prepends site_prefix."""
     from tdom_path.tree import RelativePathStrategy
@@ -523,6 +579,69 @@ def test_render_path_nodes_with_custom_strategy():
     assert result.attrs["href"].startswith("mysite/static")
 
 
+def test_render_path_nodes_calculates_repeated_asset_once():
+    """Test render_path_nodes() calculates each distinct asset once per render."""
+    calls = []
+
+    class CountingStrategy:
+        def calculate_path(self, source, target):
+            calls.append(source)
+            return "counted.css"
+
+    tree = make_path_nodes(
+        html(t"""
+            <head>
+                <link rel="stylesheet" href="static/styles.css">
+                <link rel="preload" href="static/styles.css">
+                <script src="static/app.js"></script>
+            </head>
+        """),
+        Heading,
+    )
+
+    result = render_path_nodes(
+        tree, PurePosixPath("index.html"), strategy=CountingStrategy()
+    )
+
+    # Two distinct assets, three references
+    assert len(calls) == 2
+    links = get_all_by_tag_name(result, "link")
+    assert [link.attrs["href"] for link in links] == ["counted.css", "counted.css"]
+
+
+def test_render_path_nodes_reads_collected_assets_once():
+    """Test strategies without collected assets are only asked once per render."""
+
+    class NonCollectingStrategy:
+        def __init__(self):
+            self.reads = 0
+
+        @property
+        def collected_assets(self):
+            # Counts every lookup and implicitly returns None: nothing is collected
+            self.reads += 1
+
+        def calculate_path(self, source, target):
+            return "plain.css"
+
+    tree = make_path_nodes(
+        html(t"""
+            <head>
+                <link rel="stylesheet" href="static/styles.css">
+                <script src="static/app.js"></script>
+            </head>
+        """),
+        Heading,
+    )
+    strategy = NonCollectingStrategy()
+
+    # One lookup per render pass, not one per TraversableElement
+    render_path_nodes(tree, PurePosixPath("index.html"), strategy=strategy)
+    assert strategy.reads == 1
+    render_path_nodes(tree, PurePosixPath("about.html"), strategy=strategy)
+    assert strategy.reads == 2
+
+
 def test_render_path_nodes_optimization_no_path_elements():
     """Test render_path_nodes() returns same object when no TraversableElements."""
     tree = Element(
@@ -851,6 +970,53 @@ def test_path_nodes_decorator_components():
     assert "static/script.js" in str(script.attrs["src"])
 
 
+def test_path_nodes_function_component_with_object_argument():
+    """Test function components resolve against themselves, not their arguments."""
+    from types import SimpleNamespace
+
+    @path_nodes
+    def card(item):
+        return html(t'<link rel="stylesheet" href="static/styles.css">')
+
+    # The argument has a __dict__ but is not the component
+    link = get_by_tag_name(card(SimpleNamespace(title="Post")), "link")
+    assert "test_tree" in str(link.attrs["href"])
+
+
+def test_path_nodes_self_or_cls_parameter_called_by_keyword():
+    """Test self/cls-first components work when called with keywords only."""
+
+    @path_nodes
+    def button(cls):
+        return html(t'<link rel="stylesheet" href="static/styles.css">')
+
+    # tdom passes attributes as keywords - a cls string is not the component
+    link = get_by_tag_name(button(cls="primary"), "link")
+    assert "test_tree" in str(link.attrs["href"])
+
+    class Card:
+        @path_nodes
+        def __call__(self):
+            return html(t'<link rel="stylesheet" href="static/styles.css">')
+
+    # An instance passed by keyword is still used as the component
+    link = get_by_tag_name(Card.__call__(self=Card()), "link")
+    assert "test_tree" in str(link.attrs["href"])
+
+
+def test_path_nodes_callable_without_signature():
+    """Test callables inspect.signature() rejects can still be decorated."""
+
+    def heading():
+        return html(t'<link rel="stylesheet" href="static/styles.css">')
+
+    # An invalid __signature__ makes inspect.signature() raise TypeError
+    heading.__signature__ = object()
+
+    link = get_by_tag_name(path_nodes(heading)(), "link")
+    assert "test_tree" in str(link.attrs["href"])
+
+
 def test_make_path_nodes_unchanged_nodes():
     """Test that unchanged nodes return the same object (optimization)."""
     tree = html(t"""
@@ -874,6 +1040,39 @@ def test_make_path_nodes_unchanged_nodes():
     assert body is new_body
 
 
+class _CustomElement(Element):
+    """Element subclass, standing in for nodes from libraries extending tdom."""
+
+    __slots__ = ()
+
+
+def test_make_path_nodes_element_subclasses():
+    """Test Element subclasses are walked and transformed like Element."""
+    # Assets inside a subclass container are validated...
+    tree = _CustomElement(
+        tag="head",
+        attrs={},
+        children=[Element(tag="link", attrs={"href": "static/missing.css"})],
+    )
+    with pytest.raises(FileNotFoundError, match="missing.css"):
+        make_path_nodes(tree, Heading)
+
+    # ...and rewritten, including a <link> that is itself a subclass instance
+    tree = _CustomElement(
+        tag="head",
+        attrs={},
+        children=[_CustomElement(tag="link", attrs={"href": "static/styles.css"})],
+    )
+    link = make_path_nodes(tree, Heading).children[0]
+    assert isinstance(link, TraversableElement)
+    assert _is_traversable_or_wrapped(link.attrs["href"])
+
+    # The fused pipeline renders them too
+    target = PurePosixPath("mysite/pages/index.html")
+    rendered_link = make_and_render_path_nodes(tree, Heading, target).children[0]
+    assert rendered_link.attrs["href"] == "../components/heading/static/styles.css"
+
+
 # ============================================================================
 # Integration Tests (Task Group 4)
 # ============================================================================
@@ -935,6 +1134,35 @@ def test_integration_full_pipeline_make_to_render():
     assert p.children[0].text == "Test content"
 
 
+def test_make_and_render_path_nodes_matches_two_step_pipeline():
+    """Test the single-pass pipeline renders the same tree and assets as two steps."""
+    tree = html(t"""
+        <html>
+            <head>
+                <link rel="stylesheet" href="static/styles.css">
+                <link rel="icon" href="https://example.com/favicon.ico">
+                <script src="static/app.js"></script>
+            </head>
+            <body>
+                <p>Test content</p>
+            </body>
+        </html>
+    """)
+    target = PurePosixPath("mysite/pages/about.html")
+
+    two_step_strategy = RelativePathStrategy()
+    two_step = render_path_nodes(
+        make_path_nodes(tree, Heading), target, two_step_strategy
+    )
+
+    fused_strategy = RelativePathStrategy()
+    fused = make_and_render_path_nodes(tree, Heading, target, fused_strategy)
+
+    assert str(fused) == str(two_step)
+    assert fused_strategy.collected_assets == two_step_strategy.collected_assets
+    assert not isinstance(get_by_tag_name(fused, "link"), TraversableElement)
+
+
 def test_integration_site_prefix_realistic_scenario():
     """Test with site_prefix in realistic multi-page scenario."""
     # Create component tree with assets
@@ -1281,6 +1509,42 @@ def test_make_path_nodes_validates_assets():
     assert "missing.css" in error_msg
 
 
+def test_make_path_nodes_validates_cached_assets():
+    """Test that missing assets keep failing validation on repeated transforms."""
+    tree = html(t'<link rel="stylesheet" href="static/missing.css">')
+
+    # Only assets that pass validation are cached
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError, match="missing.css"):
+            make_path_nodes(tree, Heading)
+
+
+def test_make_path_nodes_parent_segments_and_hidden_files():
+    """Test ../ segments are folded into module paths and leading dots kept."""
+    # ../ steps up from the component's package and is normalized away
+    tree = html(t'<link rel="stylesheet" href="../heading/static/styles.css">')
+    link = get_by_tag_name(make_path_nodes(tree, Heading), "link")
+    href = link.attrs["href"]
+    assert href.traversable.is_file()
+    assert href.module_path == PurePosixPath(
+        "mysite/components/heading/static/styles.css"
+    )
+
+    # Paths climbing above the module root would escape a build's output dir
+    tree = html(t'<link rel="stylesheet" href="../../../../styles.css">')
+    with pytest.raises(ValueError, match="climbs above"):
+        make_path_nodes(tree, Heading)
+
+    # A hidden file keeps its leading dot in both the Traversable and the path
+    @path_nodes
+    def hidden():
+        return html(t'<link rel="stylesheet" href="static/.hidden.css">')
+
+    href = get_by_tag_name(hidden(), "link").attrs["href"]
+    assert href.traversable.name == ".hidden.css"
+    assert href.module_path.name == ".hidden.css"
+
+
 def test_make_path_nodes_validates_multiple_assets():
     """Test validation runs for all assets in tree."""
     import pytest
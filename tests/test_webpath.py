@@ -240,3 +240,37 @@ def test_relative_path_with_prefix():
     # Test with plain relative path
     result2 = make_traversable(Heading, "static/styles.css")
     assert isinstance(result2, Traversable)
+
+
+def test_relative_path_keeps_leading_dots():
+    """Test only a literal ./ prefix is stripped from relative paths."""
+    prefixed = make_traversable(Heading, "./static/styles.css")
+    assert str(prefixed) == str(make_traversable(Heading, "static/styles.css"))
+
+    # Dots that belong to the file name are preserved
+    assert make_traversable(Heading, ".hidden.css").name == ".hidden.css"
+    assert make_traversable(Heading, "./..styles.css").name == "..styles.css"
+
+
+def test_relative_path_resolution_is_cached():
+    """Test repeated relative paths return the cached Traversable."""
+    first = make_traversable(Heading, "static/styles.css")
+    second = make_traversable(Heading(), "static/styles.css")
+
+    # Class and instance share the module, so they share the cache entry
+    assert second is first
+
+    # Different assets resolve separately
+    other = make_traversable(Heading, "static/script.js")
+    assert other is not first
+    assert "script.js" in str(other)
+
+
+def test_package_path_resolution_is_cached():
+    """Test repeated package paths return the cached Traversable."""
+    first = make_traversable(None, "mysite:static/app.js")
+    second = make_traversable(Heading, "mysite:static/app.js")
+
+    # Package paths don't depend on the component, so both share an entry
+    assert second is first
+    assert first.is_file()